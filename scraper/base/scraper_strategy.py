@@ -10,6 +10,10 @@ from abc import ABC, abstractmethod
 
 class ScraperBase(ABC):
 
+    # True jika scraper menerima kwargs trace_sample dan trace_dir
+    # untuk merekam Playwright trace (lihat --trace-sample)
+    supports_tracing: bool = False
+
     @abstractmethod
     def fetch_listings(self) -> list[dict]:
         """
@@ -6,12 +6,26 @@ Date: 2025
 """
 
 import argparse
+import inspect
 import logging
+import os
 
-from scraper.sites.glints_scraper import GlintsScraper
+# Scraper di-import lazy oleh ScraperFactory agar --help tetap cepat
 from scraper.scraper_factory import ScraperFactory
 
 
+def sample_fraction(value: str) -> float:
+    """Validasi argumen fraksi sampling, harus antara 0 dan 1."""
+    try:
+        fraction = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid float value: '{value}'")
+
+    if not 0.0 <= fraction <= 1.0:
+        raise argparse.ArgumentTypeError(f"must be between 0 and 1, got {fraction}")
+    return fraction
+
+
 def parse_args() -> argparse.Namespace:
     """Parsing argumen dari command line."""
 
@@ -22,9 +36,8 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--site",
         type=str,
-        choices=ScraperFactory.list_available(),
         default="glints",
-        help="Name of the site to scrape (default: glints)"
+        help="Name of the site to scrape, validated by ScraperFactory (default: glints)"
     )
     
     parser.add_argument(
@@ -62,17 +75,49 @@ def parse_args() -> argparse.Namespace:
 
     parser.add_argument(
         "--log-level",
-        type=str,
+        type=str.upper,
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
         default="INFO",
         help="Level log: DEBUG, INFO, WARNING, ERROR (default: INFO)"
     )
 
+    parser.add_argument(
+        "--user-agent",
+        type=str,
+        default=None,
+        help="Override USER_AGENT from .env (opsional)"
+    )
+
+    parser.add_argument(
+        "--profile",
+        type=str,
+        nargs="?",
+        const="profile.pstats",
+        default=None,
+        help="Profile the run with cProfile and save a pstats dump (default path: profile.pstats)"
+    )
+
+    parser.add_argument(
+        "--trace-sample",
+        type=sample_fraction,
+        default=0.0,
+        help="Fraction (0-1) of listing/detail pages recorded with Playwright tracing (default: 0)"
+    )
+
+    parser.add_argument(
+        "--trace-dir",
+        type=str,
+        default="traces",
+        help="Directory for Playwright trace files (default: traces)"
+    )
+
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
 
+    logging.basicConfig(level=args.log_level)
     log = logging.getLogger(__name__)
 
     # Susun kwargs untuk dikirim ke factory
@@ -84,16 +129,37 @@ def main() -> None:
     if args.user_agent:
         kwargs["user_agent"] = args.user_agent
 
+    if args.trace_sample > 0:
+        # Scraper dari plugin belum tentu mendukung tracing
+        scraper_cls = ScraperFactory.get_scraper_class(args.site)
+        if not getattr(scraper_cls, "supports_tracing", False):
+            raise SystemExit(f"error: --trace-sample is not supported by scraper '{args.site}'")
+        kwargs["trace_sample"] = args.trace_sample
+        kwargs["trace_dir"] = args.trace_dir
+
     # inisialisasi scraper
     scraper = ScraperFactory.create_scraper(args.site, **kwargs)
 
     log.info(f"Running scraper {args.site} with limit={args.limit}")
 
-    scraper.scrape_and_save(
-        limit=args.limit,
-        out_path=args.out,
-        save_csv=args.csv
-    )
-
-    if __name__ == "__main__":
-        main()
\ No newline at end of file
+    if args.profile:
+        from scraper.utils.profiler import Profiler
+
+        # Ringkas hot spot di modul scraper yang dipilih
+        focus = os.path.basename(inspect.getfile(type(scraper)))
+        with Profiler.profile_run(args.profile, focus=focus):
+            scraper.scrape_and_save(
+                limit=args.limit,
+                out_path=args.out,
+                save_csv=args.csv
+            )
+    else:
+        scraper.scrape_and_save(
+            limit=args.limit,
+            out_path=args.out,
+            save_csv=args.csv
+        )
+
+
+if __name__ == "__main__":
+    main()
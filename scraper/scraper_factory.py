@@ -6,40 +6,149 @@ Name: Afif Alli Ma'ruf
 Date: 2025
 """
 
-from scraper.sites.glints_scraper import GlintsScraper
+import importlib
+import json
+import logging
+
+from scraper.utils.site_config import SiteConfig
+
+
+log = logging.getLogger(__name__)
+
+# Group entry point untuk scraper dari package lain
+ENTRY_POINT_GROUP = "job_intel_id.scrapers"
+
 
 class ScraperFactory:
-    
+
     """
     Factory untuk memilih scraper berdasarkan nama situs.
+
+    Scraper didaftarkan sebagai string "module:Class" dan baru di-import
+    ketika dipilih. Sumber pendaftaran (prioritas tertinggi dulu):
+        1. key "scraper" di file konfigurasi situs (lihat SiteConfig),
+           sehingga override di SCRAPER_CONFIG_DIR bisa mengganti class bawaan
+        2. registry (bawaan atau lewat ScraperFactory.register)
+        3. entry point group "job_intel_id.scrapers"
+
+    Class scraper bawaan hanya didaftarkan di registry,
+    file konfigurasi bawaan tidak berisi key "scraper".
     """
 
     # Registrasi situs
     registry = {
-        "glints": GlintsScraper,
+        "glints": "scraper.sites.glints_scraper:GlintsScraper",
     }
 
+    # Cache hasil discovery entry point
+    _entry_points: dict | None = None
+
     @staticmethod
-    def create_scraper(site: str, **kwargs):
+    def register(site: str, target) -> None:
         """
         Args:
-            site(str): nama website yang akan di scrape
-            **kwargs: keyword arguments
+            site(str): nama website
+            target: class scraper atau string "module:Class"
+        """
+        ScraperFactory.registry[site.lower()] = target
+
+    @staticmethod
+    def _discover_entry_points() -> dict:
+        """Nama entry point scraper, tanpa meng-import modulnya."""
+        if ScraperFactory._entry_points is None:
+            # Import di sini karena importlib.metadata cukup berat untuk startup
+            from importlib.metadata import entry_points
+
+            ScraperFactory._entry_points = {
+                ep.name.lower(): ep for ep in entry_points(group=ENTRY_POINT_GROUP)
+            }
+        return ScraperFactory._entry_points
+
+    @staticmethod
+    def _load_class(target):
+        """Import class dari string "module:Class", class dikembalikan apa adanya."""
+        if not isinstance(target, str):
+            return target
+
+        module_path, _, class_name = target.partition(":")
+        if not class_name:
+            raise ValueError(f"Invalid scraper path '{target}', expected 'module:Class'")
+        module = importlib.import_module(module_path)
+        return getattr(module, class_name)
+
+    @staticmethod
+    def _resolve(site: str, config: dict):
+        """Cari class scraper untuk situs, import hanya scraper yang dipilih."""
+        if "scraper" in config:
+            return ScraperFactory._load_class(config["scraper"])
+
+        if site in ScraperFactory.registry:
+            return ScraperFactory._load_class(ScraperFactory.registry[site])
+
+        entry_point = ScraperFactory._discover_entry_points().get(site)
+        if entry_point is not None:
+            return entry_point.load()
+
+        return None
+
+    @staticmethod
+    def get_scraper_class(site: str):
+        """
+        Args:
+            site(str): nama website
+
+        Returns:
+            Class scraper untuk situs (di-import jika belum)
         """
-        
-        # Normalisasi input
         site = site.lower()
+        scraper_cls = ScraperFactory._resolve(site, SiteConfig.load(site))
 
-        if site not in ScraperFactory.registry:
-            available = ", ".join(ScraperFactory.registry.keys())
+        if scraper_cls is None:
+            available = ", ".join(ScraperFactory.list_available())
             raise ValueError(
                 f"Scraper '{site}' not found. "
                 f"Choices: {available}"
             )
-        
-        return ScraperFactory.registry[site](**kwargs)
-    
+
+        log.debug(f"Resolved scraper {site}: {scraper_cls}")
+        return scraper_cls
+
+    @staticmethod
+    def create_scraper(site: str, **kwargs):
+        """
+        Args:
+            site(str): nama website yang akan di scrape
+            **kwargs: keyword arguments
+        """
+
+        # Normalisasi input
+        site = site.lower()
+
+        scraper_cls = ScraperFactory.get_scraper_class(site)
+        config = SiteConfig.load(site)
+        if config:
+            kwargs.setdefault("site_config", config)
+        return scraper_cls(**kwargs)
+
+    @staticmethod
+    def _config_sites() -> list:
+        """Situs dari file konfigurasi yang memiliki key "scraper"."""
+        sites = []
+        for site in SiteConfig.list_sites():
+            try:
+                config = SiteConfig.load(site)
+            except json.JSONDecodeError as e:
+                log.warning(f"Skipping site config: {e}")
+                continue
+            if "scraper" in config:
+                sites.append(site)
+        return sites
+
     @staticmethod
     def list_available() -> list:
         """Daftar scraper yang tersedia"""
-        return list(ScraperFactory.registry.keys())
\ No newline at end of file
+        sites = list(ScraperFactory.registry.keys())
+        for site in ScraperFactory._config_sites() + list(ScraperFactory._discover_entry_points()):
+            if site not in sites:
+                sites.append(site)
+        return sites
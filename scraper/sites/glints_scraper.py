@@ -7,6 +7,7 @@ Date: 2025
 
 import os
 import time
+import random
 import json
 import csv
 import logging
@@ -14,6 +15,8 @@ from tqdm import tqdm
 from typing import List, Dict, Optional
 from scraper.base.scraper_strategy import ScraperBase
 from scraper.utils.playwright_helper import PlaywrightHelper
+from scraper.utils.site_config import SiteConfig
+from scraper.utils.retry_queue import FetchError, RetryQueue, CircuitBreaker, SITE_HEALTH_ERRORS, get_policy, parse_retry_after
 from dotenv import load_dotenv
 from playwright.sync_api import TimeoutError as PlaywrightTimeout
 
@@ -24,18 +27,72 @@ load_dotenv()
 log = logging.getLogger(__name__)
 
 # Inisialisasi variable
-GLINTS_URL = os.getenv("GLINTS_URL") or "https://glints.com/id/opportunities/jobs/explore?keyword=data"
+GLINTS_URL = os.getenv("GLINTS_URL")
 DEFAULT_DELAY = float(os.getenv("SCRAPE_DELAY", 2))
 DEFAULT_USER_AGENT = os.getenv("USER_AGENT", None)
+# Timeout navigasi halaman detail (ms), dibuat pendek karena kegagalan di-retry lewat RetryQueue
+DETAIL_TIMEOUT = int(os.getenv("DETAIL_TIMEOUT", 30000))
+# Key selector yang wajib ada di konfigurasi situs
+REQUIRED_SELECTORS = [
+    "listing_ready", "job_card", "job_anchor", "job_anchor_fallback",
+    "title", "company", "location",
+    "description", "description_fallback", "salary",
+    "requirements", "requirements_fallback", "posted",
+]
 
 class GlintsScraper(ScraperBase):
-    def __init__(self, base_url: str | None = None, headless: bool = True, delay: float | None = None, user_agent: Optional[str] = None):
-        self.base_url = base_url or GLINTS_URL
+    supports_tracing = True
+
+    def __init__(self, base_url: str | None = None, headless: bool = True, delay: float | None = None, user_agent: Optional[str] = None, trace_sample: float = 0.0, trace_dir: str = "traces", site_config: Optional[Dict] = None):
+        # Konfigurasi situs (URL, selector) dari scraper/sites/configs/glints.json
+        self.site_config = site_config if site_config is not None else SiteConfig.load("glints")
+        SiteConfig.require(self.site_config, "glints", ["base_url", "job_url_prefix", "selectors"])
+        self.selectors = self.site_config["selectors"]
+        # Validasi di awal karena error selector di fetch_job_detail hanya di-log
+        SiteConfig.require(self.selectors, "glints", REQUIRED_SELECTORS)
+        self.job_url_prefix = self.site_config["job_url_prefix"]
+        self.base_url = base_url or GLINTS_URL or self.site_config["base_url"]
         self.headless = headless
         self.delay = DEFAULT_DELAY if delay is None else delay
         self.user_agent = user_agent or DEFAULT_USER_AGENT
+        # Fraksi halaman (0-1) yang direkam dengan Playwright tracing
+        self.trace_sample = trace_sample
+        self.trace_dir = trace_dir
+        self._trace_count = 0
         log.debug(f"GlintsScraper init: {self.base_url}, {self.headless}, {self.delay}, {self.user_agent}")
 
+    def _start_trace(self, context, name: str) -> Optional[str]:
+        """
+        Mulai Playwright tracing untuk sebagian halaman sesuai trace_sample
+
+        Args:
+            context: Playwright browser context
+            name: Jenis halaman, dipakai sebagai prefix nama file
+
+        Returns:
+            str: Alamat file trace jika halaman ini direkam, selain itu None
+        """
+        if self.trace_sample <= 0 or random.random() >= self.trace_sample:
+            return None
+
+        self._trace_count += 1
+        os.makedirs(self.trace_dir, exist_ok=True)
+        trace_path = os.path.join(self.trace_dir, f"{name}_{self._trace_count:04d}_{int(time.time())}.zip")
+        context.tracing.start(screenshots=True, snapshots=True, sources=False)
+        return trace_path
+
+    def _close_context(self, context, trace_path: Optional[str] = None) -> None:
+        """
+        Simpan trace (jika ada) lalu tutup context
+        """
+        if trace_path:
+            try:
+                context.tracing.stop(path=trace_path)
+                log.info(f"Saved trace to {trace_path}")
+            except Exception as e:
+                log.warning(f"Could not save trace {trace_path}: {e}")
+        context.close()
+
     def _apply_stealth(self, page) -> None:
         """
         Menerapkan stealth script untuk menghindari deteksi bot.
@@ -57,9 +114,67 @@ class GlintsScraper(ScraperBase):
             });
         """)
 
+    def _selector_list(self, key: str) -> List[str]:
+        """
+        Ambil selector dari konfigurasi situs sebagai list,
+        konfigurasi boleh berupa string tunggal atau list string
+        """
+        selector = self.selectors[key]
+        return [selector] if isinstance(selector, str) else list(selector)
+
+    def _selector(self, key: str) -> str:
+        """
+        Ambil selector dari konfigurasi situs,
+        list selector digabung menjadi satu selector CSS
+        """
+        return ", ".join(self._selector_list(key))
+
+    def _goto(self, page, url: str, timeout: int = 90000) -> None:
+        """
+        Navigasi ke URL satu kali tanpa retry
+
+        Args:
+            page: Playwright page object
+            url: URL tujuan
+            timeout: Timeout navigasi dalam milidetik
+
+        Raises:
+            FetchError: Jika gagal, dengan kind sesuai kelas error
+        """
+        try:
+            # Gunakan domcontentloaded
+            response = page.goto(
+                url,
+                timeout=timeout,
+                wait_until="domcontentloaded"
+            )
+        except PlaywrightTimeout as e:
+            raise FetchError("timeout", str(e)) from e
+        except Exception as e:
+            raise FetchError("error", str(e)) from e
+
+        # Tunggu network idle dengan timeout terpisah
+        try:
+            page.wait_for_load_state("networkidle", timeout=15000)
+        except PlaywrightTimeout:
+            log.debug("Network idle timeout, continuing anyway...")
+
+        # Cek response status
+        if response and response.status >= 400:
+            if response.status == 429:
+                kind = "http_429"
+            elif response.status >= 500:
+                kind = "http_5xx"
+            else:
+                kind = "http_4xx"
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
+            raise FetchError(kind, f"HTTP {response.status} for {url}", retry_after=retry_after)
+
     def _safe_goto(self, page, url: str, max_retries: int = 3) -> bool:
         """
-        Navigasi ke URL dengan retry logic
+        Navigasi ke URL dengan retry logic.
+        Hanya dipakai untuk halaman listing, halaman detail
+        di-retry lewat RetryQueue di scrape_and_save.
 
         Args:
             page: Playwright page object
@@ -69,43 +184,20 @@ class GlintsScraper(ScraperBase):
         Returns:
         bool: True jika berhasil, False jika gagal
         """
-        for attempt in range(max_retries):
+        for attempt in range(1, max_retries + 1):
             try:
-                log.debug(f"Attempt {attempt + 1} to load {url}")
-
-                # Gunakan domcontentloaded
-                response = page.goto(
-                    url,
-                    timeout=90000,
-                    wait_until="domcontentloaded"
-                )
-
-                # Tunggu network idle dengan timeout terpisah
-                try:
-                    page.wait_for_load_state("networkidle", timeout=15000)
-                except PlaywrightTimeout:
-                    log.debug("Network idle timeout, continuing anyway...")
-                
-                # Cek response status
-                if response and response.status >= 400:
-                    log.warning(f"HTTP {response.status} for {url}")
-                    if attempt < max_retries -1:
-                        time.sleep(2 ** attempt)
-                        continue
-                    return False
+                log.debug(f"Attempt {attempt} to load {url}")
+                self._goto(page, url)
                 return True
-            except PlaywrightTimeout as e:
-                log.warning(f"Timeout attemp {attempt + 1}: {e}")
-                if attempt < max_retries -1:
-                    time.sleep(2 ** attempt)
-                else:
+            except FetchError as e:
+                log.warning(f"Attempt {attempt} failed ({e.kind}): {e}")
+                policy = get_policy(e.kind)
+                if attempt >= max_retries or not policy.should_retry(attempt):
                     return False
-            except Exception as e:
-                log.error(f"Unexpected error: {e}")
-                if attempt < max_retries -1:
-                    time.sleep(2 ** attempt)
-                else:
+                if policy.exceeds_max(e.retry_after):
+                    log.error(f"Retry-After {e.retry_after:.0f}s exceeds max {policy.max_delay:.0f}s, giving up")
                     return False
+                time.sleep(policy.delay(attempt, e.retry_after))
         return False
 
     def fetch_listings(self, limit: int = 100) -> List[Dict]:
@@ -127,6 +219,7 @@ class GlintsScraper(ScraperBase):
         
             # Buka tab baru
             page, context = PlaywrightHelper.create_page_with_ua(browser, self.user_agent)
+            trace_path = self._start_trace(context, "listing")
             
             # Terapkan stealth
             self._apply_stealth(page)
@@ -134,7 +227,7 @@ class GlintsScraper(ScraperBase):
             # Navigasi dengan retry
             if not self._safe_goto(page, self.base_url):
                 log.error("Failed to load page after retries")
-                context.close()
+                self._close_context(context, trace_path)
                 return results
 
             time.sleep(self.delay)
@@ -150,16 +243,16 @@ class GlintsScraper(ScraperBase):
             while len(results) < limit and scroll_tries < max_scroll:
                 # Tunggu hingga job cards muncul
                 try:
-                    page.wait_for_selector('a[href*="/opportunities/jobs/"]', timeout=30000)
+                    page.wait_for_selector(self._selector("listing_ready"), timeout=30000)
                 except PlaywrightTimeout:
                     log.warning("Timeout waiting for job cards")
                     break
 
                 # Ambil semua elemen <a> yang hrefnya mengandung /opportunities
-                job_cards = page.query_selector_all('div[class*="JobCard"], article, div[class*="OpportunityCard"]')
+                job_cards = page.query_selector_all(self._selector("job_card"))
 
                 if not job_cards:
-                    job_cards = page.query_selector_all('a[href*="/opportunities/jobs/"]')
+                    job_cards = page.query_selector_all(self._selector("job_anchor"))
                 log.debug(f"Found {len(job_cards)} candidate anchors")
 
                 for card in job_cards:
@@ -167,7 +260,7 @@ class GlintsScraper(ScraperBase):
                         break
 
                     # Ekstrak URL
-                    anchor = card.query_selector('a[href*="/opportunities/jobs/"]')
+                    anchor = card.query_selector(self._selector("job_anchor"))
                     if not anchor:
                         # Jika card sendiri adalah anchor
                         anchor = card if card.evaluate('el => el.tagName') == 'A' else None
@@ -178,37 +271,22 @@ class GlintsScraper(ScraperBase):
                     href = anchor.get_attribute("href")
                     # Normalisasi url
                     if not href:
-                        link_elem = anchor.query_selector('a[href*="/opportunities/"]')
+                        link_elem = anchor.query_selector(self._selector("job_anchor_fallback"))
                         href = link_elem.get_attribute("href") if link_elem else None
                     if not href:
                         continue
-                    url = href if href.startswith("http") else f"https://glints.com/{href}"
+                    url = href if href.startswith("http") else f"{self.job_url_prefix}{href}"
 
                     # Ekstrak title
-                    title_elem = card.query_selector(
-                        '[data-testid*="title"], '
-                        '[class*="JobCardTitle"], '
-                        'h3, h2, '
-                        'a[href*="/opportunities/jobs/"]'
-                    )
+                    title_elem = card.query_selector(self._selector("title"))
                     title = title_elem.inner_text().strip() if title_elem else None
 
                     # Ekstrak nama perusahaan
-                    company_elem = card.query_selector(
-                        '[data-testid*="company-name"], '
-                        '[class*="CompanyLink"], '
-                        '[class*="CompanyName"], '
-                        'a[href*="/companies/"]'
-                    )
+                    company_elem = card.query_selector(self._selector("company"))
                     company = company_elem.inner_text().strip() if company_elem else None
 
                     # Ekstrak lokasi
-                    location_elem = card.query_selector(
-                        '[data-testid*="location"], '
-                        '[class*="Location"], '
-                        'svg[class*="location"] + span, '
-                        '[class*="CityLabel"]'
-                    )
+                    location_elem = card.query_selector(self._selector("location"))
                     location = location_elem.inner_text().strip() if location_elem else None
 
                     # Mencegah duplikasi
@@ -250,11 +328,22 @@ class GlintsScraper(ScraperBase):
                         scroll_tries = 0
                         
             # Tutup context
-            context.close()
+            self._close_context(context, trace_path)
             log.info(f"Collected {results} listing summaries")
         return results[:limit]
                     
     
+    @staticmethod
+    def _empty_detail(url: str) -> Dict:
+        """Data detail kosong, dipakai sebagai nilai awal dan untuk URL yang gagal."""
+        return {
+            "description": None,
+            "salary": None,
+            "requirements": None,
+            "posted": None,
+            "url": url
+        }
+
     def fetch_job_detail(self, url: str) -> Dict:
         """
         Buka halaman job detail dan ambil deskripsi
@@ -265,50 +354,42 @@ class GlintsScraper(ScraperBase):
 
         Returns:
             Dict: Mengembalikan Dictionary
+
+        Raises:
+            FetchError: Jika halaman detail gagal dimuat
         """
 
         # Data awal
-        data = {
-            "description": None,
-            "salary": None,
-            "requirements": None,
-            "posted": None,
-            "url": url
-        }
+        data = self._empty_detail(url)
 
         # Buka browser
         with PlaywrightHelper.browser_context(headless=self.headless) as (_, browser):
             
             # Buka tab baru
             page, context = PlaywrightHelper.create_page_with_ua(browser, self.user_agent)
+            trace_path = self._start_trace(context, "detail")
             
             # Terapkan stealth
             self._apply_stealth(page)
 
-            # Navigasi dengan retry
-            if not self._safe_goto(page, url):
-                log.warning(f"Failed to load detail page: {url}")
-                context.close()
-                return data
+            # Navigasi satu kali, retry ditangani oleh pemanggil
+            try:
+                self._goto(page, url, timeout=DETAIL_TIMEOUT)
+            except FetchError:
+                self._close_context(context, trace_path)
+                raise
 
             # Ekstrak data deskripsi
             try:
-                desc_selectors = [
-                    "div[data-testid='job-description']",
-                    "div.job-description",
-                    "div[class*='JobDescription']",
-                    "div[class*='jobDescription']",
-                ]
-                
                 desc = None
-                for selector in desc_selectors:
+                for selector in self._selector_list("description"):
                     if page.query_selector(selector):
                         desc = page.inner_text(selector).strip()
                         break
                 
                 if not desc:
                     # Fallback ke main content
-                    desc = page.inner_text("main").strip()[:5000]
+                    desc = page.inner_text(self._selector("description_fallback")).strip()[:5000]
                 
                 data["description"] = desc
             except Exception as e:
@@ -316,14 +397,7 @@ class GlintsScraper(ScraperBase):
 
             # Ekstrak data gaji
             try:
-                salary_selectors = [
-                    'span[data-testid="salary-range"]',
-                    'div[class*="SalaryRange"] span',
-                    'span[class*="salary"]',
-                    'div[class*="SalaryJobOverview"] span'
-                ]
-                
-                for selector in salary_selectors:
+                for selector in self._selector_list("salary"):
                     elem = page.query_selector(selector)
                     if elem:
                         data['salary'] = elem.inner_text().strip()
@@ -333,11 +407,9 @@ class GlintsScraper(ScraperBase):
                 
             # Ekstrak data requirements
             try:
-                bullets = page.query_selector_all(
-                    "div[data-testid='job-description'] ul li"
-                )
+                bullets = page.query_selector_all(self._selector("requirements"))
                 if not bullets:
-                    bullets = page.query_selector_all("main ul li")
+                    bullets = page.query_selector_all(self._selector("requirements_fallback"))
                     
                 if bullets:
                     data['requirements'] = [b.inner_text().strip() for b in bullets[:20]]
@@ -346,12 +418,12 @@ class GlintsScraper(ScraperBase):
 
             # Ekstrak tanggal posting
             try:
-                posted = page.query_selector('span[class*="TopFoldsc__PostedAt"]')
+                posted = page.query_selector(self._selector("posted"))
                 if posted:
                     data['posted'] = posted.inner_text().strip()
             except Exception as e:
                 log.debug(f"Could not extract posted date: {e}")
-            context.close()
+            self._close_context(context, trace_path)
         return data
     
     def scrape_and_save(self, limit: int = 100, out_path: str | None = None, save_csv: bool = False) -> List[Dict]:
@@ -373,22 +445,89 @@ class GlintsScraper(ScraperBase):
         listings = self.fetch_listings(limit=limit)
         log.info(f"Jumlah listings didapat: {len(listings)}")
 
-        # Tempat menyimpan full jobs data
-        full_jobs = []
-        # Ambil detail setiap listing
-        for idx, item in tqdm(enumerate(listings, start=1), total=len(listings), desc="Fetching job details"):
-            log.info(f"Fetching detail {idx}, {len(listings)}, {item.get('url')}")
+        # Tempat menyimpan full jobs data, urutan mengikuti listings
+        full_jobs: List[Optional[Dict]] = [None] * len(listings)
+        # URL baru yang belum pernah di-fetch
+        pending = list(range(len(listings)))
+        pending.reverse()
+        # URL gagal yang menunggu retry
+        retry_queue = RetryQueue()
+        breaker = CircuitBreaker()
+        failures = 0
+
+        progress = tqdm(total=len(listings), desc="Fetching job details")
+        while pending or retry_queue:
+            # Hentikan sementara fetching jika circuit terbuka
+            wait = breaker.wait_time()
+            if wait > 0:
+                log.warning(f"Circuit open, pausing fetching for {wait:.1f}s")
+                time.sleep(wait)
+                continue
+
+            # Saat half-open, probe dengan URL baru karena retry sudah diketahui gagal.
+            # Selain itu prioritaskan retry yang sudah siap, lalu URL baru
+            ready = None if breaker.is_half_open and pending else retry_queue.pop_ready()
+            if ready:
+                idx, attempt = ready
+            elif pending:
+                idx, attempt = pending.pop(), 0
+            else:
+                # Hanya tersisa retry yang belum siap
+                time.sleep(retry_queue.next_ready_in())
+                continue
+
+            item = listings[idx]
+            attempt += 1
+            log.info(f"Fetching detail {idx + 1}/{len(listings)} (attempt {attempt}): {item.get('url')}")
             try:
                 detail = self.fetch_job_detail(item["url"])
             except Exception as e:
-                detail = {}
-
-            # Gabungkan list job dengan detail job
-            merged = {**item, **detail}
-            full_jobs.append(merged)
+                kind = e.kind if isinstance(e, FetchError) else "error"
+                # Error permanen per-URL (4xx, bug lokal) tidak dihitung sebagai kesehatan situs,
+                # dan tiap URL hanya dihitung gagal sekali meskipun di-retry
+                if kind in SITE_HEALTH_ERRORS:
+                    breaker.record(False, key=item["url"])
+
+                policy = get_policy(kind)
+                retry_after = e.retry_after if isinstance(e, FetchError) else None
+                # Server meminta jeda lebih lama dari max_delay: jangan tunggu, catat sebagai gagal
+                too_long = policy.exceeds_max(retry_after)
+
+                if policy.should_retry(attempt) and not too_long:
+                    delay = retry_queue.push(idx, kind, attempt, retry_after)
+                    log.warning(f"Detail failed ({kind}): {item.get('url')}, retry in {delay:.1f}s")
+                else:
+                    error = f"{kind}: {e}"
+                    if too_long:
+                        error += f" (Retry-After {retry_after:.0f}s exceeds max {policy.max_delay:.0f}s)"
+                    log.error(f"Detail failed after {attempt} attempts ({error}): {item.get('url')}")
+                    full_jobs[idx] = {
+                        **item,
+                        **self._empty_detail(item["url"]),
+                        "fetch_status": "failed",
+                        "fetch_error": error,
+                        "fetch_attempts": attempt,
+                    }
+                    failures += 1
+                    progress.update(1)
+            else:
+                breaker.record(True)
+                # Gabungkan list job dengan detail job
+                full_jobs[idx] = {
+                    **item,
+                    **detail,
+                    "fetch_status": "ok",
+                    "fetch_error": None,
+                    "fetch_attempts": attempt,
+                }
+                progress.update(1)
 
             time.sleep(self.delay)
-        
+        progress.close()
+
+        if failures:
+            log.warning(f"{failures}/{len(listings)} job details failed to fetch")
+
         if out_path:
             out_json = out_path if out_path.endswith(".json") else f"{out_path}.json"
             # Buat direktori jika belum ada
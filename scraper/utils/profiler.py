@@ -0,0 +1,99 @@
+"""
+File yang berisi helper untuk profiling proses scraper
+menggunakan cProfile/pstats.
+
+Name: Afif Alli Ma'ruf
+Date: 2025
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+from contextlib import contextmanager
+from typing import Generator
+
+
+log = logging.getLogger(__name__)
+
+
+class Profiler:
+    @staticmethod
+    @contextmanager
+    def profile_run(out_path: str, focus: str | None = None, top: int = 15) -> Generator[cProfile.Profile, None, None]:
+        """
+        Context manager untuk menjalankan cProfile dan menyimpan dump pstats
+
+        Args:
+            out_path: Alamat file dump .pstats
+            focus: Potongan path file yang diringkas hot spot-nya (mis. "glints_scraper.py")
+            top: Jumlah baris hot spot yang ditampilkan
+
+        Usage:
+            with Profiler.profile_run("run.pstats", focus="glints_scraper.py"):
+                scraper.scrape_and_save(...)
+        """
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield profiler
+        finally:
+            profiler.disable()
+
+            # Buat direktori jika belum ada
+            out_dir = os.path.dirname(out_path)
+            if out_dir:
+                os.makedirs(out_dir, exist_ok=True)
+            profiler.dump_stats(out_path)
+            log.info(f"Saved profile to {out_path}")
+
+            stats = pstats.Stats(profiler)
+            log.info("Top hot spots (cumulative):\n" + Profiler.format_top(stats, top))
+            if focus:
+                log.info(f"Hot spots in {focus}:\n" + Profiler.summarize(stats, focus, top))
+
+    @staticmethod
+    def format_top(stats: pstats.Stats, top: int = 15) -> str:
+        """Tabel pstats standar, diurutkan berdasarkan cumulative time."""
+        buf = io.StringIO()
+        stats.stream = buf
+        stats.sort_stats("cumulative").print_stats(top)
+        return buf.getvalue()
+
+    @staticmethod
+    def summarize(stats: pstats.Stats, focus: str, top: int = 15) -> str:
+        """
+        Ringkasan hot spot untuk fungsi di file tertentu
+
+        Kolom own(s) adalah waktu di badan fungsi itu sendiri. Kolom
+        callees(s) = cum(s) - own(s) adalah waktu di semua fungsi yang
+        dipanggil: helper scraper, generator, kode Python client Playwright,
+        serta menunggu IPC browser dan network. Kolom ini tidak memisahkan
+        ketiganya.
+
+        Catatan: sync API Playwright berpindah greenlet saat menunggu
+        browser, sehingga atribusi waktu cProfile yang melewati perpindahan
+        greenlet hanya perkiraan.
+
+        Args:
+            stats: Objek pstats.Stats
+            focus: Potongan path file yang difilter
+            top: Jumlah baris yang ditampilkan
+
+        Returns:
+            str: Tabel ringkasan
+        """
+        rows = []
+        for (filename, lineno, func), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+            if focus in filename:
+                rows.append((func, lineno, ncalls, tottime, cumtime))
+
+        rows.sort(key=lambda r: r[4], reverse=True)
+
+        lines = [f"{'function':<30} {'calls':>7} {'own(s)':>9} {'cum(s)':>9} {'callees(s)':>10}"]
+        for func, lineno, ncalls, tottime, cumtime in rows[:top]:
+            lines.append(
+                f"{f'{func}:{lineno}':<30} {ncalls:>7} {tottime:>9.3f} {cumtime:>9.3f} {cumtime - tottime:>10.3f}"
+            )
+        return "\n".join(lines)
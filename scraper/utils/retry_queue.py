@@ -0,0 +1,253 @@
+"""
+File yang berisi antrian retry tertunda (deferred retry queue)
+dan circuit breaker untuk proses fetching.
+
+Name: Afif Alli Ma'ruf
+Date: 2025
+"""
+
+import heapq
+import itertools
+import logging
+import random
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+
+
+log = logging.getLogger(__name__)
+
+
+class FetchError(Exception):
+    """
+    Error saat fetch halaman, dengan kelas error (kind)
+    yang dipakai untuk memilih retry policy.
+
+    Args:
+        kind: Kelas error, key di RETRY_POLICIES
+        message: Pesan error
+        retry_after: Delay (detik) dari header Retry-After, jika ada
+    """
+
+    def __init__(self, kind: str, message: str = "", retry_after: Optional[float] = None):
+        super().__init__(message or kind)
+        self.kind = kind
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parsing header Retry-After (detik atau HTTP-date) menjadi detik
+
+    Returns:
+        float: Delay dalam detik, None jika header kosong/tidak valid
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Aturan retry untuk satu kelas error.
+
+    Args:
+        max_attempts: Total percobaan (termasuk percobaan pertama)
+        base_delay: Delay dasar backoff dalam detik
+        max_delay: Batas atas delay backoff dalam detik
+        floor: Jika True, delay minimal base_delay (untuk 429/5xx
+            agar retry tidak langsung dijalankan)
+    """
+
+    def __init__(self, max_attempts: int, base_delay: float, max_delay: float = 60.0, floor: bool = False):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.floor = floor
+
+    def should_retry(self, attempt: int) -> bool:
+        """True jika masih boleh retry setelah percobaan ke-`attempt`."""
+        return attempt < self.max_attempts
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Jittered exponential backoff:
+        random antara lower dan cap = min(max_delay, base_delay * 2^(attempt-1)),
+        lower = base_delay jika floor, selain itu 0 (full jitter)
+        """
+        cap = min(self.max_delay, self.base_delay * (2 ** max(attempt - 1, 0)))
+        lower = min(self.base_delay, cap) if self.floor else 0.0
+        return lower + random.uniform(0, cap - lower)
+
+    def exceeds_max(self, retry_after: Optional[float]) -> bool:
+        """True jika Retry-After dari server lebih lama dari max_delay."""
+        return retry_after is not None and retry_after > self.max_delay
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Delay sebelum retry, tidak kurang dari Retry-After jika server mengirimnya.
+        Retry-After dibatasi max_delay, cek exceeds_max() untuk menyerah lebih awal.
+        """
+        delay = self.backoff(attempt)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+
+# Retry policy per kelas error
+RETRY_POLICIES = {
+    "timeout": RetryPolicy(max_attempts=3, base_delay=2.0),
+    "http_429": RetryPolicy(max_attempts=4, base_delay=10.0, max_delay=120.0, floor=True),
+    "http_5xx": RetryPolicy(max_attempts=3, base_delay=4.0, floor=True),
+    # 4xx selain 429 tidak akan berubah jika diulang
+    "http_4xx": RetryPolicy(max_attempts=1, base_delay=0.0),
+    "error": RetryPolicy(max_attempts=2, base_delay=2.0),
+}
+
+
+# Kelas error yang menandakan situs sedang bermasalah,
+# hanya ini yang dihitung oleh CircuitBreaker
+SITE_HEALTH_ERRORS = {"timeout", "http_429", "http_5xx"}
+
+
+def get_policy(kind: str) -> RetryPolicy:
+    """Ambil retry policy untuk kelas error, fallback ke 'error'."""
+    return RETRY_POLICIES.get(kind, RETRY_POLICIES["error"])
+
+
+class RetryQueue:
+    """
+    Antrian item yang gagal, diurutkan berdasarkan waktu siap retry.
+    Item tidak memblokir loop utama, hanya diambil ketika sudah siap.
+    """
+
+    def __init__(self):
+        self._heap: list = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, item: Any, kind: str, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Masukkan item ke antrian dengan jittered backoff.
+
+        Args:
+            item: Item yang akan di-retry
+            kind: Kelas error percobaan terakhir
+            attempt: Jumlah percobaan yang sudah dilakukan
+            retry_after: Delay minimal dari header Retry-After
+
+        Returns:
+            float: Delay (detik) sebelum item siap di-retry
+        """
+        delay = get_policy(kind).delay(attempt, retry_after)
+        ready_at = time.monotonic() + delay
+        heapq.heappush(self._heap, (ready_at, next(self._counter), item, attempt))
+        return delay
+
+    def pop_ready(self) -> Optional[tuple[Any, int]]:
+        """
+        Ambil item yang sudah siap di-retry.
+
+        Returns:
+            Tuple(item, attempt) atau None jika belum ada yang siap
+        """
+        if self._heap and self._heap[0][0] <= time.monotonic():
+            _, _, item, attempt = heapq.heappop(self._heap)
+            return item, attempt
+        return None
+
+    def next_ready_in(self) -> float:
+        """Sisa waktu (detik) sampai item berikutnya siap."""
+        if not self._heap:
+            return 0.0
+        return max(0.0, self._heap[0][0] - time.monotonic())
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker berbasis error rate pada sliding window.
+
+    Ketika error rate >= threshold, circuit terbuka (open) dan fetching
+    dihentikan sementara selama cooldown. Setelah cooldown, circuit
+    half-open: hasil request berikutnya menentukan, sukses menutup
+    circuit, gagal membukanya kembali.
+
+    Hanya error dari SITE_HEALTH_ERRORS yang sebaiknya dicatat sebagai
+    gagal, error permanen per-URL (mis. 404) bukan tanda situs bermasalah.
+    Jika key (mis. URL) diberikan, tiap key hanya dihitung gagal sekali,
+    sehingga retry dari satu URL yang lambat tidak membuka circuit.
+
+    Args:
+        window: Jumlah hasil terakhir yang dihitung
+        threshold: Batas error rate (0-1)
+        min_samples: Minimal sampel sebelum circuit bisa terbuka
+        cooldown: Lama circuit terbuka dalam detik
+    """
+
+    def __init__(self, window: int = 20, threshold: float = 0.5, min_samples: int = 5, cooldown: float = 60.0):
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.cooldown = cooldown
+        self._outcomes: deque = deque(maxlen=window)
+        self._opened_at: Optional[float] = None
+        self._failed_keys: set = set()
+
+    @property
+    def is_half_open(self) -> bool:
+        """True jika cooldown sudah lewat dan circuit menunggu hasil probe."""
+        return self._opened_at is not None and self.wait_time() == 0.0
+
+    def wait_time(self) -> float:
+        """Sisa waktu (detik) sampai request boleh dijalankan, 0 jika boleh sekarang."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self.cooldown - (time.monotonic() - self._opened_at))
+
+    def record(self, success: bool, key: Optional[str] = None) -> None:
+        """
+        Catat hasil satu request.
+
+        Args:
+            success: True jika request berhasil
+            key: Identitas item (mis. URL), kegagalan berulang dari key yang sama diabaikan
+        """
+        if not success and key is not None:
+            if key in self._failed_keys:
+                return
+            self._failed_keys.add(key)
+
+        if self._opened_at is not None:
+            # Hasil probe saat half-open
+            if success:
+                log.info("Circuit closed, resuming fetching")
+                self._opened_at = None
+                self._outcomes.clear()
+            else:
+                log.warning(f"Probe failed, circuit re-opened for {self.cooldown}s")
+                self._opened_at = time.monotonic()
+            return
+
+        self._outcomes.append(success)
+        if len(self._outcomes) >= self.min_samples:
+            error_rate = self._outcomes.count(False) / len(self._outcomes)
+            if error_rate >= self.threshold:
+                log.warning(
+                    f"Error rate {error_rate:.0%} >= {self.threshold:.0%}, "
+                    f"circuit opened for {self.cooldown}s"
+                )
+                self._opened_at = time.monotonic()
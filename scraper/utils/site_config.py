@@ -0,0 +1,111 @@
+"""
+File yang berisi class SiteConfig
+untuk membaca konfigurasi situs (URL, selector) dari file data.
+
+Name: Afif Alli Ma'ruf
+Date: 2025
+"""
+
+import json
+import logging
+import os
+
+
+log = logging.getLogger(__name__)
+
+# Direktori konfigurasi bawaan
+BUILTIN_CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "sites", "configs")
+
+
+class SiteConfig:
+    @staticmethod
+    def config_dirs() -> list[str]:
+        """
+        Daftar direktori konfigurasi.
+        Direktori dari env SCRAPER_CONFIG_DIR (dipisah os.pathsep)
+        dicek lebih dulu sehingga bisa meng-override konfigurasi bawaan.
+        """
+        extra = os.getenv("SCRAPER_CONFIG_DIR")
+        dirs = [d for d in extra.split(os.pathsep) if d] if extra else []
+        return dirs + [BUILTIN_CONFIG_DIR]
+
+    @staticmethod
+    def list_sites() -> list[str]:
+        """Nama situs yang memiliki file konfigurasi (tanpa membaca isinya)."""
+        sites = []
+        for config_dir in SiteConfig.config_dirs():
+            if not os.path.isdir(config_dir):
+                continue
+            for filename in sorted(os.listdir(config_dir)):
+                name, ext = os.path.splitext(filename)
+                if ext == ".json" and name not in sites:
+                    sites.append(name)
+        return sites
+
+    @staticmethod
+    def find_all(site: str) -> list[str]:
+        """Alamat semua file konfigurasi situs, prioritas tertinggi dulu."""
+        paths = []
+        for config_dir in SiteConfig.config_dirs():
+            path = os.path.join(config_dir, f"{site}.json")
+            if os.path.isfile(path):
+                paths.append(path)
+        return paths
+
+    @staticmethod
+    def merge(base: dict, override: dict) -> dict:
+        """
+        Deep-merge override ke base, dict digabung rekursif
+        sedangkan list dan nilai lain diganti
+        """
+        merged = dict(base)
+        for key, value in override.items():
+            if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merged[key] = SiteConfig.merge(merged[key], value)
+            else:
+                merged[key] = value
+        return merged
+
+    @staticmethod
+    def _read(path: str) -> dict:
+        """Baca satu file konfigurasi, error JSON disertai alamat file."""
+        with open(path, encoding="utf-8") as f:
+            try:
+                return json.load(f)
+            except json.JSONDecodeError as e:
+                raise json.JSONDecodeError(f"Invalid site config {path}: {e.msg}", e.doc, e.pos) from e
+
+    @staticmethod
+    def load(site: str) -> dict:
+        """
+        Baca konfigurasi situs.
+        File di SCRAPER_CONFIG_DIR di-merge di atas konfigurasi bawaan,
+        sehingga override cukup berisi key yang diubah.
+
+        Args:
+            site: Nama situs
+
+        Returns:
+            dict: Isi konfigurasi, dict kosong jika tidak ada file
+        """
+        config: dict = {}
+        # Mulai dari prioritas terendah (bawaan)
+        for path in reversed(SiteConfig.find_all(site)):
+            config = SiteConfig.merge(config, SiteConfig._read(path))
+            log.debug(f"Loaded site config {site} from {path}")
+        return config
+
+    @staticmethod
+    def require(config: dict, site: str, keys: list[str]) -> None:
+        """
+        Validasi key wajib di konfigurasi situs
+
+        Raises:
+            ValueError: Jika ada key yang tidak ada
+        """
+        missing = [key for key in keys if key not in config]
+        if missing:
+            raise ValueError(
+                f"Site config '{site}' is missing required keys: {', '.join(missing)}. "
+                f"Searched: {', '.join(SiteConfig.config_dirs())}"
+            )
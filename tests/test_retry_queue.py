@@ -0,0 +1,211 @@
+"""
+Test untuk RetryPolicy, RetryQueue, CircuitBreaker dan parse_retry_after.
+
+Name: Afif Alli Ma'ruf
+Date: 2025
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from scraper.utils import retry_queue
+from scraper.utils.retry_queue import (
+    CircuitBreaker,
+    FetchError,
+    RetryPolicy,
+    RetryQueue,
+    get_policy,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(retry_queue.time, "monotonic", fake.monotonic)
+    return fake
+
+
+# === RetryPolicy ===
+
+def test_backoff_full_jitter_within_cap():
+    policy = RetryPolicy(max_attempts=3, base_delay=2.0, max_delay=5.0)
+    delays = [policy.backoff(4) for _ in range(200)]
+    assert all(0.0 <= d <= 5.0 for d in delays)
+
+
+def test_backoff_floor_never_below_base():
+    policy = get_policy("http_429")
+    assert min(policy.backoff(1) for _ in range(200)) >= policy.base_delay
+
+
+def test_delay_honours_retry_after():
+    policy = RetryPolicy(max_attempts=3, base_delay=1.0, max_delay=60.0)
+    assert policy.delay(1, retry_after=30.0) >= 30.0
+
+
+def test_delay_clamps_retry_after_to_max_delay():
+    policy = get_policy("http_429")
+    assert policy.delay(1, retry_after=3600.0) <= policy.max_delay
+    assert policy.exceeds_max(3600.0)
+    assert not policy.exceeds_max(None)
+
+
+def test_should_retry_respects_max_attempts():
+    policy = get_policy("http_4xx")
+    assert not policy.should_retry(1)
+    assert get_policy("timeout").should_retry(2)
+    assert not get_policy("timeout").should_retry(3)
+
+
+def test_unknown_kind_falls_back_to_error_policy():
+    assert get_policy("nope") is get_policy("error")
+
+
+# === parse_retry_after ===
+
+def test_parse_retry_after_seconds():
+    assert parse_retry_after("120") == 120.0
+
+
+def test_parse_retry_after_http_date():
+    future = datetime.now(timezone.utc) + timedelta(seconds=90)
+    assert 80 <= parse_retry_after(format_datetime(future, usegmt=True)) <= 90
+
+
+@pytest.mark.parametrize("value", [None, "", "soon"])
+def test_parse_retry_after_invalid(value):
+    assert parse_retry_after(value) is None
+
+
+# === RetryQueue ===
+
+def test_retry_queue_only_pops_ready_items(clock):
+    queue = RetryQueue()
+    delay = queue.push("u1", "timeout", 1, retry_after=10.0)
+
+    assert queue.pop_ready() is None
+    assert queue.next_ready_in() == pytest.approx(delay)
+
+    clock.sleep(delay)
+    assert queue.pop_ready() == ("u1", 1)
+    assert len(queue) == 0
+
+
+def test_retry_queue_orders_by_ready_time(clock):
+    queue = RetryQueue()
+    queue.push("late", "timeout", 1, retry_after=20.0)
+    queue.push("early", "timeout", 1, retry_after=5.0)
+
+    clock.sleep(60)
+    assert queue.pop_ready() == ("early", 1)
+    assert queue.pop_ready() == ("late", 1)
+
+
+# === CircuitBreaker ===
+
+def test_breaker_opens_on_distinct_failures(clock):
+    breaker = CircuitBreaker(min_samples=4, threshold=0.5, cooldown=60.0)
+    for url in ["u0", "u1", "u2", "u3"]:
+        breaker.record(url == "u0", key=url)
+
+    assert breaker.wait_time() == pytest.approx(60.0)
+
+
+def test_breaker_counts_one_failure_per_url(clock):
+    """Satu URL yang selalu timeout tidak boleh membuka circuit."""
+    breaker = CircuitBreaker(min_samples=5, threshold=0.5, cooldown=60.0)
+
+    # Retry u1 diprioritaskan sehingga kegagalannya berkumpul di window
+    breaker.record(True, key="u0")
+    for _ in range(3):
+        breaker.record(False, key="u1")
+    for i in range(2, 10):
+        breaker.record(True, key=f"u{i}")
+
+    assert breaker.wait_time() == 0.0
+    assert not breaker.is_half_open
+
+
+def test_breaker_half_open_probe(clock):
+    breaker = CircuitBreaker(min_samples=2, threshold=0.5, cooldown=30.0)
+    breaker.record(False, key="u0")
+    breaker.record(False, key="u1")
+    assert breaker.wait_time() > 0
+
+    clock.sleep(30)
+    assert breaker.is_half_open
+
+    # Probe gagal membuka kembali circuit
+    breaker.record(False, key="u2")
+    assert breaker.wait_time() == pytest.approx(30.0)
+
+    clock.sleep(30)
+    breaker.record(True, key="u3")
+    assert breaker.wait_time() == 0.0
+    assert not breaker.is_half_open
+
+
+# === scrape_and_save ===
+
+def test_slow_url_does_not_stall_crawl(clock, monkeypatch):
+    """10 listing, hanya u1 yang selalu timeout: circuit tidak boleh terbuka."""
+    for module in ["playwright", "tqdm", "dotenv"]:
+        pytest.importorskip(module)
+    from scraper.sites import glints_scraper
+
+    monkeypatch.setattr(glints_scraper.time, "sleep", clock.sleep)
+
+    class StubScraper(glints_scraper.GlintsScraper):
+        def fetch_listings(self, limit=100):
+            return [{"url": f"u{i}"} for i in range(10)]
+
+        def fetch_job_detail(self, url):
+            if url == "u1":
+                raise FetchError("timeout", "slow")
+            return {"url": url}
+
+    start = clock.now
+    results = StubScraper(delay=2.0).scrape_and_save()
+
+    assert [r["fetch_status"] for r in results].count("failed") == 1
+    assert results[1]["fetch_attempts"] == get_policy("timeout").max_attempts
+    # Tanpa jeda circuit (cooldown 60s)
+    assert clock.now - start < 60
+
+
+def test_long_retry_after_marks_url_failed(clock, monkeypatch):
+    """Retry-After melebihi max_delay: URL langsung gagal, tidak menunggu."""
+    for module in ["playwright", "tqdm", "dotenv"]:
+        pytest.importorskip(module)
+    from scraper.sites import glints_scraper
+
+    monkeypatch.setattr(glints_scraper.time, "sleep", clock.sleep)
+
+    class StubScraper(glints_scraper.GlintsScraper):
+        def fetch_listings(self, limit=100):
+            return [{"url": "u0"}]
+
+        def fetch_job_detail(self, url):
+            raise FetchError("http_429", "HTTP 429", retry_after=3600.0)
+
+    start = clock.now
+    results = StubScraper(delay=0).scrape_and_save()
+
+    assert results[0]["fetch_status"] == "failed"
+    assert results[0]["fetch_attempts"] == 1
+    assert "Retry-After 3600s" in results[0]["fetch_error"]
+    assert clock.now - start < 60
@@ -0,0 +1,45 @@
+"""
+Test untuk argumen command line run_scraper.
+
+Name: Afif Alli Ma'ruf
+Date: 2025
+"""
+
+import json
+import sys
+
+import pytest
+
+from scraper import run_scraper
+
+
+def run_main(monkeypatch, *argv: str) -> None:
+    monkeypatch.setattr(sys, "argv", ["run_scraper.py", *argv])
+    run_scraper.main()
+
+
+def test_log_level_rejects_unknown_value(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["run_scraper.py", "--log-level", "LOUD"])
+    with pytest.raises(SystemExit):
+        run_scraper.parse_args()
+
+
+def test_log_level_is_case_insensitive(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["run_scraper.py", "--log-level", "debug"])
+    assert run_scraper.parse_args().log_level == "DEBUG"
+
+
+@pytest.mark.parametrize("value", ["1.5", "-0.1", "abc"])
+def test_trace_sample_rejects_out_of_range(monkeypatch, value):
+    monkeypatch.setattr(sys, "argv", ["run_scraper.py", "--trace-sample", value])
+    with pytest.raises(SystemExit):
+        run_scraper.parse_args()
+
+
+def test_trace_sample_requires_tracing_support(tmp_path, monkeypatch):
+    # Plugin scraper tanpa supports_tracing
+    (tmp_path / "plugin.json").write_text(json.dumps({"scraper": "collections:OrderedDict"}), encoding="utf-8")
+    monkeypatch.setenv("SCRAPER_CONFIG_DIR", str(tmp_path))
+
+    with pytest.raises(SystemExit, match="not supported"):
+        run_main(monkeypatch, "--site", "plugin", "--trace-sample", "0.5")
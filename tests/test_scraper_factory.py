@@ -0,0 +1,73 @@
+"""
+Test untuk ScraperFactory dan SiteConfig.
+
+Name: Afif Alli Ma'ruf
+Date: 2025
+"""
+
+import json
+from collections import OrderedDict
+
+import pytest
+
+from scraper.scraper_factory import ScraperFactory
+from scraper.utils.site_config import SiteConfig
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCRAPER_CONFIG_DIR", str(tmp_path))
+    return tmp_path
+
+
+def write_config(config_dir, site: str, data: dict) -> None:
+    (config_dir / f"{site}.json").write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_override_merges_over_builtin_config(config_dir):
+    write_config(config_dir, "glints", {"base_url": "https://example.test", "selectors": {"salary": "span.salary"}})
+    config = SiteConfig.load("glints")
+
+    assert config["base_url"] == "https://example.test"
+    assert config["selectors"]["salary"] == "span.salary"
+    # Key lain tetap dari konfigurasi bawaan
+    assert "description" in config["selectors"]
+
+
+def test_invalid_json_reports_path(config_dir):
+    (config_dir / "broken.json").write_text("{bad", encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError, match="broken.json"):
+        SiteConfig.load("broken")
+
+
+def test_config_scraper_key_overrides_registry(config_dir):
+    write_config(config_dir, "glints", {"scraper": "collections:OrderedDict"})
+    assert ScraperFactory._resolve("glints", SiteConfig.load("glints")) is OrderedDict
+
+
+def test_unknown_site_raises(config_dir):
+    with pytest.raises(ValueError, match="not found"):
+        ScraperFactory.create_scraper("nope")
+
+
+def test_list_available_skips_configs_without_scraper(config_dir):
+    write_config(config_dir, "bad", {"base_url": "https://example.test"})
+    write_config(config_dir, "plugin", {"scraper": "collections:OrderedDict"})
+    (config_dir / "broken.json").write_text("{bad", encoding="utf-8")
+
+    available = ScraperFactory.list_available()
+    assert "glints" in available
+    assert "plugin" in available
+    assert "bad" not in available
+    assert "broken" not in available
+
+
+def test_glints_requires_every_selector():
+    for module in ["playwright", "tqdm", "dotenv"]:
+        pytest.importorskip(module)
+    from scraper.sites.glints_scraper import GlintsScraper
+
+    config = SiteConfig.load("glints")
+    del config["selectors"]["salary"]
+    with pytest.raises(ValueError, match="salary"):
+        GlintsScraper(site_config=config)